@@ -3,16 +3,68 @@
 SaturdayMorningPlex - Automated playlist generator for Plex
 Creates Saturday morning cartoon-style weekly playlists
 """
-from flask import Flask, render_template, jsonify, request
+from flask import Blueprint, Flask, Response, current_app, g, render_template, jsonify, request, make_response
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
+import orjson
 import os
+import atexit
+import queue
 import sys
+import time
+import hashlib
+import uuid
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
-from plex_connection import PlexConnection
-from playlist_generator import PlaylistGenerator
 
 # Configure logging for Docker and UnRAID compatibility
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue.
+    When the queue is full, records below WARNING are dropped so a log burst
+    cannot grow memory without limit; warnings and errors wait up to
+    put_timeout seconds for space, then are dropped too. Drops are counted.
+    """
+    put_timeout = 0.5
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.WARNING:
+            try:
+                self.queue.put(record, timeout=self.put_timeout)
+                return
+            except queue.Full:
+                pass
+        self.dropped += 1
+
+class BoundedQueueListener(QueueListener):
+    """QueueListener whose shutdown tolerates a full queue"""
+    def stop(self):
+        if self._thread is None:
+            return
+        try:
+            self.queue.put(self._sentinel, timeout=DroppingQueueHandler.put_timeout)
+        except queue.Full:
+            # No room for the stop marker; the daemon thread ends with the process
+            self._thread = None
+            return
+        self._thread.join()
+        self._thread = None
+
 def setup_logging():
     """
     Configure logging to output to both stdout (Docker logs) and file (UnRAID logs).
@@ -20,7 +72,7 @@ def setup_logging():
     - UnRAID: Logs to /config/logs/saturdaymorningplex.log (persistent)
     - Formats: ISO8601 timestamps, structured logging
     """
-    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    log_level = LOG_LEVEL
     log_format = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
     
@@ -31,22 +83,24 @@ def setup_logging():
     # Remove any existing handlers
     root_logger.handlers.clear()
     
+    # One formatter shared by the console and file handlers
+    formatter = logging.Formatter(log_format, datefmt=date_format)
+    
     # Console handler (stdout) - for Docker logs
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
-    console_formatter = logging.Formatter(log_format, datefmt=date_format)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
     
     # File handler - for UnRAID persistent logs
-    log_dir = os.getenv('LOG_DIR', '/config/logs')
+    log_dir = LOG_DIR
     if not os.path.exists(log_dir):
         try:
             os.makedirs(log_dir, exist_ok=True)
         except (OSError, PermissionError) as e:
             # If can't create log directory, log to /tmp as fallback
             log_dir = '/tmp'
-            root_logger.warning(f"Could not create log directory, using {log_dir}: {e}")
+            root_logger.warning("Could not create log directory, using %s: %s", log_dir, e)
     
     log_file = os.path.join(log_dir, 'saturdaymorningplex.log')
     try:
@@ -57,33 +111,78 @@ def setup_logging():
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(log_format, datefmt=date_format)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
-        root_logger.info(f"File logging enabled: {log_file}")
+        root_logger.info("File logging enabled: %s", log_file)
     except (OSError, PermissionError) as e:
-        root_logger.warning(f"Could not create log file {log_file}: {e}")
+        root_logger.warning("Could not create log file %s: %s", log_file, e)
+    
+    # Hand the configured handlers to a background listener so request
+    # threads only enqueue records instead of blocking on stdout/file I/O
+    log_queue = queue.Queue(maxsize=10000)
+    listener = BoundedQueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    queue_handler = DroppingQueueHandler(log_queue)
+    root_logger.handlers.clear()
+    root_logger.addHandler(queue_handler)
+    listener.start()
+    
+    def stop_logging():
+        listener.stop()
+        if queue_handler.dropped:
+            sys.stderr.write(f"{queue_handler.dropped} log records dropped while the log queue was full\n")
+    atexit.register(stop_logging)
     
     # Log startup information
     root_logger.info("="*60)
     root_logger.info("SaturdayMorningPlex Starting")
-    root_logger.info(f"Log Level: {log_level}")
-    root_logger.info(f"Python Version: {sys.version}")
-    root_logger.info(f"Log Directory: {log_dir}")
+    root_logger.info("Log Level: %s", log_level)
+    root_logger.info("Python Version: %s", sys.version)
+    root_logger.info("Log Directory: %s", log_dir)
     root_logger.info("="*60)
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Keys stay sorted like Flask's default provider so ETags are stable.
+    """
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.options),
+            mimetype='application/json'
+        )
+
+bp = Blueprint('main', __name__)
 
-# Suppress Flask's default logging to avoid duplicate entries
-log = logging.getLogger('werkzeug')
-log.setLevel(logging.WARNING)
+def parse_list(value):
+    """
+    Normalize a comma-separated string or a list into a list of names.
+    Used for content ratings and library names from env vars and requests.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    if isinstance(value, list):
+        return value
+    return [value]
 
-# Configuration from environment variables
+# Configuration from environment variables (read once; setup_logging and
+# the routes use these constants rather than calling os.getenv again)
 APP_PORT = int(os.getenv('APP_PORT', 5000))
 APP_HOST = os.getenv('APP_HOST', '0.0.0.0')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_DIR = os.getenv('LOG_DIR', '/config/logs')
 
 # Plex configuration
 PLEX_URL = os.getenv('PLEX_URL', '')
@@ -91,60 +190,334 @@ PLEX_TOKEN = os.getenv('PLEX_TOKEN', '')
 PLEX_USERNAME = os.getenv('PLEX_USERNAME', '')
 PLEX_PASSWORD = os.getenv('PLEX_PASSWORD', '')
 PLEX_SERVER_NAME = os.getenv('PLEX_SERVER_NAME', '')
+PLEX_VERIFY_SSL = os.getenv('PLEX_VERIFY_SSL', 'false').lower() in ('1', 'true', 'yes')
 TV_LIBRARY_NAME = os.getenv('TV_LIBRARY_NAME', 'TV Shows')
-CONTENT_RATINGS = os.getenv('CONTENT_RATINGS', 'G,PG').split(',')
-CONTENT_RATINGS = [rating.strip() for rating in CONTENT_RATINGS if rating.strip()]
+CONTENT_RATINGS = parse_list(os.getenv('CONTENT_RATINGS', 'G,PG'))
+CONTENT_RATINGS_CSV = ','.join(CONTENT_RATINGS)
 
-# Global Plex connection (will be initialized on first use)
-plex_conn = None
+# Startup configuration never changes, so resolve it once
+PLEX_CONFIGURED = bool(PLEX_URL and PLEX_TOKEN) or bool(PLEX_USERNAME and PLEX_PASSWORD)
 
-logger.debug(f"Environment: PLEX_URL={'set' if PLEX_URL else 'not set'}, "
-             f"PLEX_TOKEN={'set' if PLEX_TOKEN else 'not set'}, "
-             f"TV_LIBRARY={TV_LIBRARY_NAME}, "
-             f"CONTENT_RATINGS={CONTENT_RATINGS}")
+# In-process cache for Plex library metadata (sections, content ratings)
+PLEX_CACHE_TIMEOUT = int(os.getenv('PLEX_CACHE_TIMEOUT', 300))
 
-@app.route('/')
-def index():
-    """Main page"""
-    logger.info("Web interface accessed")
+# Concurrent Plex requests used while fetching episodes and writing playlists
+PLEX_FETCH_WORKERS = int(os.getenv('PLEX_FETCH_WORKERS', 8))
+cache = Cache(config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': PLEX_CACHE_TIMEOUT
+})
+
+# plexapi and its dependencies are imported where they are first used,
+# so importing app (gunicorn workers, health checks) only pays for Flask
+
+@lru_cache(maxsize=1)
+def get_plex_session():
+    """One pooled HTTP session shared by every PlexConnection in this process"""
+    from plex_connection import create_session
+    # Both background job slots may run a full fetch pool at once
+    return create_session(pool_maxsize=max(20, 2 * PLEX_FETCH_WORKERS), verify=PLEX_VERIFY_SSL)
+
+# Shared Plex connection; guarded so concurrent first requests connect once
+_plex_conn = None
+_plex_lock = threading.Lock()
+
+def get_plex_conn():
+    """
+    Shared Plex connection, created and connected on first use.
+    Failed attempts are not cached, so the next request retries.
+    """
+    global _plex_conn
+    if _plex_conn is None:
+        with _plex_lock:
+            if _plex_conn is None:
+                from plex_connection import PlexConnection
+                logger.debug("Initializing new Plex connection")
+                conn = PlexConnection(
+                    baseurl=PLEX_URL or None,
+                    token=PLEX_TOKEN or None,
+                    username=PLEX_USERNAME or None,
+                    password=PLEX_PASSWORD or None,
+                    servername=PLEX_SERVER_NAME or None,
+                    session=get_plex_session()
+                )
+                conn.connect()
+                _plex_conn = conn
+    return _plex_conn
+
+def reset_plex_conn():
+    """Drop the shared Plex connection; the next get_plex_conn() reconnects"""
+    global _plex_conn
+    with _plex_lock:
+        _plex_conn = None
+
+def iter_section(section, page_size=100):
+    """
+    Yield the items of a library section one page at a time.
+    Only a single page of Plex results is held in memory at once.
+    """
+    start = 0
+    while True:
+        page = section.search(container_start=start, container_size=page_size,
+                              maxresults=page_size)
+        if not page:
+            return
+        yield from page
+        if len(page) < page_size:
+            return
+        start += page_size
+
+@dataclass(slots=True)
+class LibrarySection:
+    """Library section summary; orjson serializes it as a JSON object"""
+    title: str
+    type: str
+    key: int
+
+@cache.memoize()
+def get_library_sections():
+    """
+    List Plex library sections as LibrarySection records.
+    Cached for PLEX_CACHE_TIMEOUT seconds.
+    """
+    sections = get_plex_conn().plex.library.sections()
+    return [
+        LibrarySection(s.title, s.type, s.key)
+        for s in sections
+    ]
+
+@cache.memoize()
+def get_library_ratings(library_name):
+    """
+    Get the sorted unique content ratings used in a TV library.
+    Cached per library for PLEX_CACHE_TIMEOUT seconds.
+    """
+    from plexapi.exceptions import BadRequest, NotFound
+    logger.debug("Fetching TV section: %s", library_name)
+    tv_section = get_plex_conn().get_tv_section(library_name)
+    
+    # Let Plex aggregate the distinct values instead of downloading every show;
+    # older plexapi releases without listFilterChoices fall back to the scan
+    try:
+        choices = tv_section.listFilterChoices('contentRating')
+        return sorted({c.title for c in choices if c.title})
+    except (BadRequest, NotFound, AttributeError) as e:
+        logger.debug("contentRating filter unavailable for '%s', scanning shows: %s", library_name, e)
+    
+    return sorted({show.contentRating for show in iter_section(tv_section) if show.contentRating})
+
+# Content ratings of the default library, owned by the refresh thread;
+# {library_name: [ratings]}, never expired, emptied by /api/plex/reset
+_ratings_cache = {}
+
+def library_ratings(library_name):
+    """
+    Content ratings for a library, preferring the background-refreshed copy.
+    Libraries the refresher doesn't track (or before its first pass) go
+    through the memoized lookup.
+    """
+    ratings = _ratings_cache.get(library_name)
+    if ratings is None:
+        ratings = get_library_ratings(library_name)
+    return ratings
+
+def refresh_library_ratings(app):
+    """
+    Background loop that keeps the default library's content ratings warm.
+    The thread owns _ratings_cache, so /api/plex/content-ratings is answered
+    from memory instead of scanning Plex on the request thread.
+    """
+    interval = max(PLEX_CACHE_TIMEOUT, 1)
+    with app.app_context():
+        while True:
+            try:
+                _ratings_cache[TV_LIBRARY_NAME] = get_library_ratings.uncached(TV_LIBRARY_NAME)
+                logger.debug("Refreshed content ratings for '%s'", TV_LIBRARY_NAME)
+            except Exception as e:
+                logger.warning("Background content rating refresh failed: %s", e)
+            time.sleep(interval)
+
+# Long-running playlist operations run off the request thread and are
+# polled through /api/jobs/<job_id>. The registry lives in this process,
+# which is why gunicorn runs a single (multi-threaded) worker by default.
+JOB_RETENTION = 3600
+job_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='playlist-job')
+jobs = {}
+jobs_lock = threading.Lock()
+
+def submit_job(kind, events):
+    """
+    Run an event iterator in the background and register it as a job
+    
+    Args:
+        kind: Short job label ('generate', 'delete')
+        events: Iterator of progress dicts ending with {'event': 'result', 'result': ...}
+    
+    Returns:
+        str: Job id for /api/jobs/<job_id>
+    """
+    job_id = uuid.uuid4().hex
+    job = {'kind': kind, 'created': time.time(), 'progress': None, 'cancel': threading.Event()}
+    app = current_app._get_current_object()
+    
+    def run():
+        try:
+            with app.app_context():
+                try:
+                    for event in events:
+                        if event['event'] == 'result':
+                            return event['result']
+                        job['progress'] = event
+                        if job['cancel'].is_set():
+                            logger.warning("Job %s (%s) cancelled", job_id, kind)
+                            return {'success': False, 'error': 'Cancelled', 'progress': event}
+                finally:
+                    # Run the generator's cleanup now, inside the app context, so a
+                    # cancelled job stops its pending Plex writes immediately
+                    events.close()
+            return {'success': False, 'error': 'Job finished without a result'}
+        except Exception as e:
+            log_failure(f"Job {job_id} ({kind}) failed", e)
+            return {'success': False, 'error': str(e)}
+    
+    with jobs_lock:
+        cutoff = time.time() - JOB_RETENTION
+        for old_id in [j for j, old in jobs.items() if old['future'].done() and old['created'] < cutoff]:
+            del jobs[old_id]
+        job['future'] = job_executor.submit(run)
+        jobs[job_id] = job
+    logger.info("Queued %s job %s", kind, job_id)
+    return job_id
+
+def etag_json(view):
+    """
+    Tag successful JSON responses with a content-hash ETag.
+    Clients sending a matching If-None-Match header get a bare 304 instead
+    of the full body.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200 or not response.is_json:
+            return response
+        digest = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        response.set_etag(digest)
+        return response.make_conditional(request)
+    return wrapper
+
+@lru_cache(maxsize=1)
+def expected_errors():
+    """
+    Exception types for anticipated failures: Plex rejecting a request or
+    credentials, the server being unreachable, or missing configuration/library.
+    Imported lazily so plexapi stays out of the module import.
+    """
+    from plexapi.exceptions import PlexApiException
+    from requests import RequestException
+    return (PlexApiException, RequestException, ValueError)
+
+def log_failure(message, e):
+    """
+    Log a handler failure. Expected errors are logged as warnings without
+    a traceback; anything else is an error with the full traceback.
+    """
+    if isinstance(e, expected_errors()):
+        logger.warning("%s: %s", message, e)
+    else:
+        logger.error("%s: %s", message, e, exc_info=True)
+
+# Endpoints that drive PlaylistGenerator with the shared connection; the
+# library/ratings endpoints go through cached helpers and connect lazily
+PLEX_ENDPOINTS = {'main.generate_playlists', 'main.get_playlists_summary', 'main.delete_playlists'}
+
+@bp.before_request
+def attach_plex_conn():
+    """Attach the shared Plex connection to g for Plex-bound endpoints"""
+    if request.endpoint not in PLEX_ENDPOINTS:
+        return None
+    try:
+        g.plex_conn = get_plex_conn()
+    except Exception as e:
+        log_failure("Failed to connect to Plex", e)
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+    return None
+
+@lru_cache(maxsize=2)
+def format_timestamp(second):
+    """Display and ISO-8601 strings for a whole-second epoch time"""
+    moment = datetime.fromtimestamp(second)
+    return moment.strftime('%Y-%m-%d %H:%M:%S'), moment.isoformat()
+
+# Stands in for the server time in the pre-rendered index page
+TIMESTAMP_PLACEHOLDER = '__SERVER_TIME__'
+
+@lru_cache(maxsize=1)
+def render_index():
+    """
+    Render index.html once; every input except the server time is fixed
+    at startup, so requests only substitute the timestamp.
+    """
     return render_template('index.html', 
                          app_name="SaturdayMorningPlex",
-                         timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                         plex_configured=bool(PLEX_URL and PLEX_TOKEN) or bool(PLEX_USERNAME and PLEX_PASSWORD),
-                         content_ratings=','.join(CONTENT_RATINGS),
+                         timestamp=TIMESTAMP_PLACEHOLDER,
+                         plex_configured=PLEX_CONFIGURED,
+                         content_ratings=CONTENT_RATINGS_CSV,
                          tv_library=TV_LIBRARY_NAME)
 
-@app.route('/health')
-def health():
-    """Health check endpoint"""
-    return jsonify({
+@bp.route('/')
+def index():
+    """Main page"""
+    logger.info("Web interface accessed")
+    return render_index().replace(TIMESTAMP_PLACEHOLDER, format_timestamp(int(time.time()))[0], 1)
+
+@lru_cache(maxsize=2)
+def health_payload(second):
+    """Encoded /health body for a whole-second epoch time"""
+    return orjson.dumps({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': format_timestamp(second)[1],
         'app': 'SaturdayMorningPlex',
-        'plex_configured': bool(PLEX_URL and PLEX_TOKEN) or bool(PLEX_USERNAME and PLEX_PASSWORD)
-    })
+        'plex_configured': PLEX_CONFIGURED
+    }, option=OrjsonProvider.options)
 
-@app.route('/api/info')
+@bp.route('/health')
+def health():
+    """Health check endpoint"""
+    return Response(health_payload(int(time.time())), mimetype='application/json')
+
+# /api/info depends only on startup configuration, so encode it once
+_INFO_PAYLOAD = orjson.dumps({
+    'name': 'SaturdayMorningPlex',
+    'version': '2.0.0',
+    'description': 'Automated Plex playlist generator for Saturday morning cartoons',
+    'environment': {
+        'port': APP_PORT,
+        'host': APP_HOST,
+        'plex_configured': PLEX_CONFIGURED,
+        'tv_library': TV_LIBRARY_NAME,
+        'content_ratings': CONTENT_RATINGS
+    }
+}, option=OrjsonProvider.options)
+_INFO_ETAG = hashlib.blake2b(_INFO_PAYLOAD, digest_size=16).hexdigest()
+
+@bp.route('/api/info')
 def info():
     """Application info endpoint"""
-    return jsonify({
-        'name': 'SaturdayMorningPlex',
-        'version': '2.0.0',
-        'description': 'Automated Plex playlist generator for Saturday morning cartoons',
-        'environment': {
-            'port': APP_PORT,
-            'host': APP_HOST,
-            'plex_configured': bool(PLEX_URL and PLEX_TOKEN) or bool(PLEX_USERNAME and PLEX_PASSWORD),
-            'tv_library': TV_LIBRARY_NAME,
-            'content_ratings': CONTENT_RATINGS
-        }
-    })
+    response = Response(_INFO_PAYLOAD, mimetype='application/json')
+    response.set_etag(_INFO_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
 
-@app.route('/api/plex/test', methods=['POST'])
+@bp.route('/api/plex/test', methods=['POST'])
 def test_plex_connection():
     """Test Plex connection with provided or stored credentials"""
     logger.info("Testing Plex connection")
     try:
+        from plex_connection import PlexConnection
         data = request.get_json() or {}
         
         # Use provided credentials or fall back to environment variables
@@ -154,7 +527,7 @@ def test_plex_connection():
         password = data.get('plex_password', PLEX_PASSWORD)
         servername = data.get('plex_servername', PLEX_SERVER_NAME)
         
-        logger.debug(f"Connection method: {'Direct' if (url and token) else 'MyPlex Account'}")
+        logger.debug("Connection method: %s", 'Direct' if (url and token) else 'MyPlex Account')
         
         # Create connection
         conn = PlexConnection(
@@ -162,160 +535,115 @@ def test_plex_connection():
             token=token if token else None,
             username=username if username else None,
             password=password if password else None,
-            servername=servername if servername else None
+            servername=servername if servername else None,
+            session=get_plex_session()
         )
         
         result = conn.test_connection()
         if result.get('success'):
-            logger.info(f"Plex connection successful: {result.get('server_name')}")
+            logger.info("Plex connection successful: %s", result.get('server_name'))
         else:
-            logger.error(f"Plex connection failed: {result.get('error')}")
+            logger.error("Plex connection failed: %s", result.get('error'))
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"Plex connection test failed: {e}", exc_info=True)
+        log_failure("Plex connection test failed", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
-@app.route('/api/plex/libraries')
+@bp.route('/api/plex/reset', methods=['POST'])
+def reset_plex_connection():
+    """Drop the shared Plex connection and cached library metadata"""
+    logger.info("Resetting shared Plex connection")
+    reset_plex_conn()
+    cache.clear()
+    _ratings_cache.clear()
+    from playlist_generator import clear_episode_cache
+    clear_episode_cache()
+    return jsonify({'success': True})
+
+@bp.route('/api/plex/libraries')
+@etag_json
 def get_plex_libraries():
     """Get available Plex library sections"""
     logger.info("Fetching Plex library sections")
     try:
-        global plex_conn
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
-        
-        sections = plex_conn.plex.library.sections()
-        logger.info(f"Found {len(sections)} library sections")
+        libraries = get_library_sections()
+        logger.info("Found %d library sections", len(libraries))
         return jsonify({
             'success': True,
-            'libraries': [
-                {
-                    'title': s.title,
-                    'type': s.type,
-                    'key': s.key
-                }
-                for s in sections
-            ]
+            'libraries': libraries
         })
     except Exception as e:
-        logger.error(f"Failed to get libraries: {e}", exc_info=True)
+        log_failure("Failed to get libraries", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
-@app.route('/api/plex/content-ratings')
+@bp.route('/api/plex/content-ratings')
+@etag_json
 def get_content_ratings():
     """Get available content ratings from TV library"""
     logger.info("Fetching available content ratings")
     try:
-        global plex_conn
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
-        
-        logger.debug(f"Fetching TV section: {TV_LIBRARY_NAME}")
-        tv_section = plex_conn.get_tv_section(TV_LIBRARY_NAME)
-        
-        # Get all unique content ratings
-        ratings = set()
-        for show in tv_section.all():
-            if show.contentRating:
-                ratings.add(show.contentRating)
-        
-        logger.info(f"Found {len(ratings)} unique content ratings")
+        ratings = library_ratings(TV_LIBRARY_NAME)
+        logger.info("Found %d unique content ratings", len(ratings))
         
         return jsonify({
             'success': True,
-            'ratings': sorted(list(ratings))
+            'ratings': ratings
         })
     except Exception as e:
-        logger.error(f"Failed to get content ratings: {e}", exc_info=True)
+        log_failure("Failed to get content ratings", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
-@app.route('/api/plex/validate-ratings', methods=['POST'])
+@bp.route('/api/plex/validate-ratings', methods=['POST'])
 def validate_content_ratings():
     """Validate that selected content ratings exist in the library"""
     logger.info("Validating content ratings")
     try:
         data = request.get_json() or {}
-        content_ratings = data.get('content_ratings', [])
-        if isinstance(content_ratings, str):
-            content_ratings = [r.strip() for r in content_ratings.split(',') if r.strip()]
+        content_ratings = parse_list(data.get('content_ratings'))
         
         tv_library = data.get('tv_library', TV_LIBRARY_NAME)
         
-        global plex_conn
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
-        
-        logger.debug(f"Fetching TV section: {tv_library}")
-        tv_section = plex_conn.get_tv_section(tv_library)
-        
-        # Get all unique content ratings in library
-        library_ratings = set()
-        for show in tv_section.all():
-            if show.contentRating:
-                library_ratings.add(show.contentRating)
+        # Unique content ratings in library (cached per library)
+        available_ratings = set(library_ratings(tv_library))
         
         # Check which selected ratings are missing
-        missing_ratings = [r for r in content_ratings if r not in library_ratings]
+        missing_ratings = [r for r in content_ratings if r not in available_ratings]
         
         if missing_ratings:
-            logger.warning(f"Selected ratings not found in library: {missing_ratings}")
+            logger.warning("Selected ratings not found in library: %s", missing_ratings)
             return jsonify({
                 'success': False,
                 'valid': False,
                 'missing_ratings': missing_ratings,
-                'available_ratings': sorted(list(library_ratings)),
+                'available_ratings': sorted(available_ratings),
                 'error': f"The following content ratings are not found in '{tv_library}': {', '.join(missing_ratings)}"
             })
         
-        logger.info(f"All selected ratings are valid: {content_ratings}")
+        logger.info("All selected ratings are valid: %s", content_ratings)
         return jsonify({
             'success': True,
             'valid': True,
             'selected_ratings': content_ratings,
-            'available_ratings': sorted(list(library_ratings))
+            'available_ratings': sorted(available_ratings)
         })
     except Exception as e:
-        logger.error(f"Failed to validate content ratings: {e}", exc_info=True)
+        log_failure("Failed to validate content ratings", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
-@app.route('/api/playlists/generate', methods=['POST'])
+@bp.route('/api/playlists/generate', methods=['POST'])
 def generate_playlists():
     """Generate Saturday Morning playlists"""
     logger.info("Playlist generation requested")
@@ -323,49 +651,41 @@ def generate_playlists():
         data = request.get_json() or {}
         
         # Get parameters
-        content_ratings = data.get('content_ratings', CONTENT_RATINGS)
-        if isinstance(content_ratings, str):
-            content_ratings = [r.strip() for r in content_ratings.split(',') if r.strip()]
+        content_ratings = parse_list(data.get('content_ratings', CONTENT_RATINGS))
         
-        tv_library = data.get('tv_library', TV_LIBRARY_NAME)
         # Support comma-separated library names
-        if isinstance(tv_library, str):
-            tv_libraries = [lib.strip() for lib in tv_library.split(',') if lib.strip()]
-        else:
-            tv_libraries = tv_library if isinstance(tv_library, list) else [tv_library]
+        tv_libraries = parse_list(data.get('tv_library', TV_LIBRARY_NAME))
         
         playlist_prefix = data.get('playlist_prefix', 'Saturday Morning')
         weeks_per_year = int(data.get('weeks_per_year', 52))
         animation_only = data.get('animation_only', False)
         
-        logger.info(f"Generation parameters: libraries={tv_libraries}, ratings={content_ratings}, "
-                   f"prefix='{playlist_prefix}', weeks={weeks_per_year}, animation_only={animation_only}")
-        
-        # Initialize connection if needed
-        global plex_conn
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
+        logger.info("Generation parameters: libraries=%s, ratings=%s, prefix='%s', weeks=%s, "
+                    "animation_only=%s", tv_libraries, content_ratings, playlist_prefix,
+                    weeks_per_year, animation_only)
+        
+        # Shared connection, attached by attach_plex_conn()
+        plex_conn = g.plex_conn
         
         # Validate content ratings exist in library/libraries
         logger.info("Validating content ratings against library...")
         all_library_ratings = set()
         
-        for lib_name in tv_libraries:
+        # Libraries are independent Plex round trips, so fetch them concurrently
+        app = current_app._get_current_object()
+        
+        def fetch_ratings(lib_name):
+            with app.app_context():
+                return library_ratings(lib_name)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(tv_libraries)))) as executor:
+            futures = {lib_name: executor.submit(fetch_ratings, lib_name) for lib_name in tv_libraries}
+        
+        for lib_name, future in futures.items():
             try:
-                tv_section = plex_conn.get_tv_section(lib_name)
-                for show in tv_section.all():
-                    if show.contentRating:
-                        all_library_ratings.add(show.contentRating)
+                all_library_ratings.update(future.result())
             except Exception as e:
-                logger.error(f"Failed to access library '{lib_name}': {e}")
+                logger.error("Failed to access library '%s': %s", lib_name, e)
                 return jsonify({
                     'success': False,
                     'error': f"Library '{lib_name}' not found or inaccessible"
@@ -379,27 +699,16 @@ def generate_playlists():
                 'success': False,
                 'error': error_msg,
                 'missing_ratings': missing_ratings,
-                'available_ratings': sorted(list(all_library_ratings))
+                'available_ratings': sorted(all_library_ratings)
             }), 400
         
         logger.info("Content ratings validated successfully")
         
-        # Continue with existing connection
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
-        
         # Generate playlists
         logger.info("Initializing PlaylistGenerator")
-        generator = PlaylistGenerator(plex_conn)
-        result = generator.generate_all_playlists(
+        from playlist_generator import PlaylistGenerator
+        generator = PlaylistGenerator(plex_conn, fetch_workers=PLEX_FETCH_WORKERS)
+        events = generator.iter_generate_playlists(
             tv_section_name=tv_libraries,  # Now supports list of library names
             content_ratings=content_ratings,
             playlist_prefix=playlist_prefix,
@@ -407,95 +716,172 @@ def generate_playlists():
             animation_only=animation_only
         )
         
-        if result.get('success'):
-            logger.info(f"Playlist generation complete: {result.get('playlists_created')} playlists created")
-        else:
-            logger.error(f"Playlist generation failed: {result.get('error')}")
+        def logged_events():
+            for event in events:
+                if event['event'] == 'result':
+                    result = event['result']
+                    if result.get('success'):
+                        logger.info("Playlist generation complete: %s playlists created", result.get('playlists_created'))
+                    else:
+                        logger.error("Playlist generation failed: %s", result.get('error'))
+                yield event
         
-        return jsonify(result)
+        job_id = submit_job('generate', logged_events())
+        return jsonify({'success': True, 'job_id': job_id}), 202
         
     except Exception as e:
-        logger.error(f"Failed to generate playlists: {e}", exc_info=True)
+        log_failure("Failed to generate playlists", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-@app.route('/api/playlists/summary')
+@bp.route('/api/playlists/summary')
+@etag_json
 def get_playlists_summary():
     """Get summary of existing playlists"""
     logger.info("Fetching playlist summary")
     try:
         playlist_prefix = request.args.get('prefix', 'Saturday Morning')
-        logger.debug(f"Searching for playlists with prefix: {playlist_prefix}")
-        
-        global plex_conn
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
+        logger.debug("Searching for playlists with prefix: %s", playlist_prefix)
         
+        plex_conn = g.plex_conn
+        
+        from playlist_generator import PlaylistGenerator
         generator = PlaylistGenerator(plex_conn)
         result = generator.get_playlist_summary(playlist_prefix)
         
         if result.get('success'):
-            logger.info(f"Found {result.get('total_playlists', 0)} playlists")
+            logger.info("Found %s playlists", result.get('total_playlists', 0))
         
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"Failed to get playlist summary: {e}", exc_info=True)
+        log_failure("Failed to get playlist summary", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
-@app.route('/api/playlists/delete', methods=['POST'])
+@bp.route('/api/playlists/delete', methods=['POST'])
 def delete_playlists():
     """Delete all Saturday Morning playlists"""
     logger.info("Playlist deletion requested")
     try:
         data = request.get_json() or {}
         playlist_prefix = data.get('playlist_prefix', 'Saturday Morning')
-        logger.warning(f"Deleting all playlists with prefix: {playlist_prefix}")
-        
-        global plex_conn
-        if not plex_conn:
-            logger.debug("Initializing new Plex connection")
-            plex_conn = PlexConnection(
-                baseurl=PLEX_URL if PLEX_URL else None,
-                token=PLEX_TOKEN if PLEX_TOKEN else None,
-                username=PLEX_USERNAME if PLEX_USERNAME else None,
-                password=PLEX_PASSWORD if PLEX_PASSWORD else None,
-                servername=PLEX_SERVER_NAME if PLEX_SERVER_NAME else None
-            )
-            plex_conn.connect()
+        logger.warning("Deleting all playlists with prefix: %s", playlist_prefix)
         
-        generator = PlaylistGenerator(plex_conn)
-        result = generator.delete_all_playlists(playlist_prefix)
+        plex_conn = g.plex_conn
         
-        if result.get('success'):
-            logger.info(f"Deleted {result.get('deleted_count', 0)} playlists")
+        from playlist_generator import PlaylistGenerator
+        generator = PlaylistGenerator(plex_conn, fetch_workers=PLEX_FETCH_WORKERS)
         
-        return jsonify(result)
+        def delete_events():
+            result = generator.delete_all_playlists(playlist_prefix)
+            if result.get('success'):
+                logger.info("Deleted %s playlists", result.get('deleted_count', 0))
+            yield {'event': 'result', 'result': result}
+        
+        job_id = submit_job('delete', delete_events())
+        return jsonify({'success': True, 'job_id': job_id}), 202
         
     except Exception as e:
-        logger.error(f"Failed to delete playlists: {e}", exc_info=True)
+        log_failure("Failed to delete playlists", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@bp.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    """Progress and result of a background playlist job"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown job: {job_id}'
+        }), 404
+    
+    future = job['future']
+    result = None
+    if future.cancelled():
+        result = {'success': False, 'error': 'Cancelled'}
+    elif future.done():
+        result = future.result()
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'kind': job['kind'],
+        'done': future.done(),
+        'progress': job['progress'],
+        'result': result
+    })
+
+@bp.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancel a background job (stops after the playlist in progress)"""
+    with jobs_lock:
+        job = jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown job: {job_id}'
+        }), 404
+    
+    logger.warning("Cancelling job %s (%s)", job_id, job['kind'])
+    job['cancel'].set()
+    job['future'].cancel()
+    return jsonify({'success': True, 'job_id': job_id})
+
+def create_app():
+    """
+    Build the Flask application.
+    Logging, extensions and the ratings refresh thread are set up here rather
+    than at import, so importing this module opens no files or threads.
+    """
+    setup_logging()
+    
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    
+    # Suppress Flask's default logging to avoid duplicate entries
+    log = logging.getLogger('werkzeug')
+    log.setLevel(logging.WARNING)
+    
+    # Compress JSON responses (brotli preferred, gzip fallback). Bodies under
+    # COMPRESS_MIN_SIZE (/health, /api/info, job status) are sent as-is.
+    app.config.update(
+        COMPRESS_MIMETYPES=['application/json'],
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_LEVEL=6,
+        COMPRESS_BR_LEVEL=4,
+        COMPRESS_MIN_SIZE=500
+    )
+    Compress(app)
+    cache.init_app(app)
+    app.register_blueprint(bp)
+    
+    logger.info("Starting SaturdayMorningPlex on %s:%s", APP_HOST, APP_PORT)
+    logger.info("Plex configured: %s", PLEX_CONFIGURED)
+    logger.info("TV Library: %s", TV_LIBRARY_NAME)
+    logger.info("Content Ratings: %s", CONTENT_RATINGS_CSV)
+    logger.debug("Environment: PLEX_URL=%s, PLEX_TOKEN=%s, TV_LIBRARY=%s, CONTENT_RATINGS=%s",
+                 'set' if PLEX_URL else 'not set', 'set' if PLEX_TOKEN else 'not set',
+                 TV_LIBRARY_NAME, CONTENT_RATINGS)
+    
+    if not app.debug and PLEX_CONFIGURED:
+        threading.Thread(target=refresh_library_ratings, args=(app,),
+                         name='ratings-refresh', daemon=True).start()
+    
+    return app
+
 if __name__ == '__main__':
-    logger.info(f"Starting SaturdayMorningPlex on {APP_HOST}:{APP_PORT}")
-    logger.info(f"Plex configured: {bool(PLEX_URL and PLEX_TOKEN) or bool(PLEX_USERNAME and PLEX_PASSWORD)}")
-    logger.info(f"TV Library: {TV_LIBRARY_NAME}")
-    logger.info(f"Content Ratings: {','.join(CONTENT_RATINGS)}")
-    logger.debug("Starting Flask application...")
-    app.run(host=APP_HOST, port=APP_PORT, debug=False)
+    if '--dev' in sys.argv:
+        create_app().run(host=APP_HOST, port=APP_PORT, debug=False, threaded=True)
+    else:
+        # Hand the process over to gunicorn (see gunicorn.conf.py); each
+        # worker builds its own app through create_app()
+        os.execvp('gunicorn', ['gunicorn', '--config', 'gunicorn.conf.py', 'app:create_app()'])
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for SaturdayMorningPlex
+Reads the same environment variables as app.py
+"""
+import os
+
+bind = f"{os.getenv('APP_HOST', '0.0.0.0')}:{os.getenv('APP_PORT', '5000')}"
+
+# Plex-bound routes spend most of their time waiting on network I/O,
+# so each worker serves requests from a pool of threads. Background job
+# state is kept per process, so one worker is the safe default.
+workers = int(os.getenv('GUNICORN_WORKERS', 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+
+# create_app() starts background threads (ratings refresh, job executor);
+# threads do not survive fork, so each worker builds its own app
+preload_app = False
@@ -3,22 +3,92 @@ Playlist generation logic for Saturday Morning Plex
 Creates weekly playlists distributed across the year
 """
 import logging
+import random
+import re
+import threading
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from collections import defaultdict
+from heapq import nlargest
+from operator import attrgetter, itemgetter
+from plexapi.exceptions import BadRequest, NotFound
+from plexapi.playlist import Playlist
 
 logger = logging.getLogger(__name__)
 
+# Sort key for EpisodeRec; the air date is resolved once at fetch time
+by_air_date = attrgetter('aired')
+episode_duration = attrgetter('duration')
+
+# Genre tag substrings that mark a show as animation, matched in one pass
+ANIMATION_GENRE_RE = re.compile('animation|cartoon|anime')
+
+# Items per request when paging through library searches
+SEARCH_PAGE_SIZE = 500
+
+# Episodes fetched by the last run: {(server, show ratingKey): (version, [EpisodeRec])}
+_episode_cache = {}
+_episode_cache_lock = threading.Lock()
+
+
+def clear_episode_cache():
+    """Forget episodes collected by earlier generation runs"""
+    with _episode_cache_lock:
+        _episode_cache.clear()
+
+
+@dataclass(slots=True)
+class EpisodeRec:
+    """Episode fields read while distributing, captured once at fetch time"""
+    show: str
+    episode: object
+    season: int
+    episode_num: int
+    title: str
+    aired: datetime
+    duration: int
+
+    @classmethod
+    def from_episode(cls, show_title, episode):
+        # Listings return partial objects; without this, reading a field
+        # that is legitimately empty (e.g. no air date) re-fetches the episode
+        episode._autoReload = False
+        return cls(
+            show=show_title,
+            episode=episode,
+            season=episode.parentIndex,
+            episode_num=episode.index,
+            title=episode.title,
+            aired=episode.originallyAvailableAt if episode.originallyAvailableAt else episode.addedAt,
+            duration=episode.duration or 0
+        )
+
+
+@dataclass(slots=True)
+class WeekSchedule:
+    """Weekly episode lists stored flat: index = (year-1)*weeks_per_year + (week-1)"""
+    weeks_per_year: int
+    weeks: list
+
+    @property
+    def years(self):
+        return -(-len(self.weeks) // self.weeks_per_year)
+
 
 class PlaylistGenerator:
     """Generates Saturday morning-style weekly playlists"""
     
-    def __init__(self, plex_connection):
+    def __init__(self, plex_connection, fetch_workers=8):
         """
         Initialize playlist generator
         
         Args:
             plex_connection: PlexConnection instance
+            fetch_workers: Concurrent Plex requests used when fetching episodes
+                and creating or deleting playlists
         """
+        self.fetch_workers = max(1, fetch_workers)
         self.plex = plex_connection.plex
         if not self.plex:
             raise ValueError("Plex connection not established")
@@ -35,80 +105,238 @@ class PlaylistGenerator:
         Returns:
             list: Filtered TV show objects
         """
-        logger.info(f"Fetching shows with content ratings: {content_ratings}, animation_only: {animation_only}")
+        logger.info("Fetching shows with content ratings: %s, animation_only: %s", content_ratings, animation_only)
+        
+        if not content_ratings:
+            logger.info("Found 0 shows matching criteria")
+            return []
+        
+        # Let Plex apply the rating filter (a list is an OR of exact values)
+        # so only matching shows are transferred and parsed
+        ratings = self._rating_choices(tv_section, content_ratings)
+        if ratings is not None and not ratings:
+            logger.info("Found 0 shows matching criteria (no selected ratings in library)")
+            return []
+        search_filters = {'contentRating': ratings if ratings is not None else list(content_ratings)}
+        if animation_only:
+            genres = self._animation_genres(tv_section)
+            if genres is not None:
+                if not genres:
+                    logger.info("Found 0 shows matching criteria (no animation genres in library)")
+                    return []
+                search_filters['genre'] = genres
+        
+        try:
+            all_shows = self._search_pages(tv_section, libtype='show', **search_filters)
+        except (BadRequest, NotFound) as e:
+            logger.warning("Server-side rating filter unavailable, filtering locally: %s", e)
+            all_shows = self._search_pages(tv_section, libtype='show')
         
-        all_shows = tv_section.all()
         filtered_shows = []
+        # Hashed, exact-match membership (never a fuzzy or prefix match);
+        # re-checked locally so the parental-control rule never depends on
+        # how the server interprets the filter
+        allowed_ratings = frozenset(content_ratings)
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for show in all_shows:
             # Check if show's content rating matches any in the list
-            if show.contentRating not in content_ratings:
-                logger.debug(f"Excluded (rating): {show.title} ({show.contentRating})")
+            if show.contentRating not in allowed_ratings:
+                if debug:
+                    logger.debug("Excluded (rating): %s (%s)", show.title, show.contentRating)
                 continue
             
             # Check animation filter if enabled
             if animation_only:
-                genres = [g.tag.lower() for g in show.genres] if hasattr(show, 'genres') and show.genres else []
+                # Read the tags once; the lowercase text (tags separated so
+                # no word can span two of them) serves every substring check
+                tags = [g.tag for g in getattr(show, 'genres', None) or ()]
+                genre_text = '|'.join(tags).lower()
                 # Check for animation-related genre tags
-                is_animation = any(
-                    'animation' in g or 
-                    'cartoon' in g or 
-                    'anime' in g
-                    for g in genres
-                )
+                is_animation = ANIMATION_GENRE_RE.search(genre_text) is not None
                 
+                if debug:
+                    genre_str = ', '.join(tags) if tags else 'No genres'
+                    if is_animation:
+                        logger.debug("Included (animation): %s (genres: %s)", show.title, genre_str)
+                    else:
+                        logger.debug("Excluded (not animation): %s (genres: %s)", show.title, genre_str)
                 if not is_animation:
-                    genre_str = ', '.join([g.tag for g in show.genres]) if hasattr(show, 'genres') and show.genres else 'No genres'
-                    logger.debug(f"Excluded (not animation): {show.title} (genres: {genre_str})")
                     continue
-                else:
-                    genre_str = ', '.join([g.tag for g in show.genres]) if hasattr(show, 'genres') and show.genres else 'No genres'
-                    logger.debug(f"Included (animation): {show.title} (genres: {genre_str})")
             
             filtered_shows.append(show)
-            logger.debug(f"Included: {show.title} ({show.contentRating})")
+            if debug:
+                logger.debug("Included: %s (%s)", show.title, show.contentRating)
         
-        logger.info(f"Found {len(filtered_shows)} shows matching criteria")
+        logger.info("Found %s shows matching criteria", len(filtered_shows))
         return filtered_shows
     
-    def get_all_episodes(self, shows):
+    def _rating_choices(self, section, content_ratings):
+        """
+        Content rating filter choices of a library for the selected ratings
+        
+        plexapi resolves plain string tag values with a filter-choices request
+        per value on every search call (so on every page); FilterChoice
+        objects are used as-is, so they are looked up once here instead.
+        
+        Args:
+            section: Plex library section
+            content_ratings: Ratings to include
+        
+        Returns:
+            list: Matching FilterChoice objects, or None if rating choices are unavailable
+        """
+        try:
+            choices = section.listFilterChoices('contentRating', libtype='show')
+        except (BadRequest, NotFound, AttributeError) as e:
+            logger.debug("Rating filter choices unavailable, passing ratings as text: %s", e)
+            return None
+        allowed = frozenset(content_ratings)
+        return [c for c in choices if c.title in allowed]
+    
+    def _animation_genres(self, tv_section):
+        """
+        Genre filter choices of a library that the animation filter accepts
+        
+        Matches the same words as the local check, so passing these to the
+        server-side genre filter drops only shows that would be excluded anyway.
+        
+        Args:
+            tv_section: Plex TV library section
+        
+        Returns:
+            list: Matching FilterChoice objects, or None if genre choices are unavailable
+        """
+        try:
+            choices = tv_section.listFilterChoices('genre', libtype='show')
+        except (BadRequest, NotFound, AttributeError) as e:
+            logger.debug("Genre filter choices unavailable, filtering locally: %s", e)
+            return None
+        return [c for c in choices if c.title and ANIMATION_GENRE_RE.search(c.title.lower())]
+    
+    def _search_pages(self, section, page_size=SEARCH_PAGE_SIZE, **kwargs):
+        """
+        Run a library search, fetching its pages concurrently
+        
+        plexapi pages through results one request at a time. This fetches
+        the first page, then requests the following pages in waves of
+        fetch_workers until one comes back short, keeping results in order.
+        
+        Args:
+            section: LibrarySection to search
+            page_size: Items per request
+            **kwargs: Passed through to section.search()
+        
+        Returns:
+            list: All matching items
+        """
+        def page(start):
+            return section.search(container_start=start, container_size=page_size,
+                                  maxresults=page_size, **kwargs)
+        
+        results = list(page(0))
+        if len(results) < page_size:
+            return results
+        
+        start = page_size
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            while True:
+                offsets = range(start, start + self.fetch_workers * page_size, page_size)
+                for items in executor.map(page, offsets):
+                    results.extend(items)
+                    if len(items) < page_size:
+                        return results
+                start = offsets.stop
+    
+    def get_all_episodes(self, shows, sections=None, content_ratings=None, animation_only=False):
         """
         Get all episodes from the shows, organized by show.
         Deduplicates episodes across libraries by selecting highest quality version.
         
         Args:
             shows: List of Show objects (may contain duplicates from multiple libraries)
+            sections: Library sections the shows came from; when given, each
+                library's episodes are listed in bulk instead of per show
+            content_ratings: Ratings the shows were filtered by, used to
+                narrow the bulk listing on the server
+            animation_only: Whether the shows were filtered by animation genre,
+                which narrows the bulk listing the same way
         
         Returns:
-            dict: {show_title: [episodes_in_order]}
+            dict: {show_title: [EpisodeRec in air date order]}
         """
-        import random
-        
         # First pass: collect all episodes with quality metrics
-        # Key format: "ShowTitle|S01E01"
-        episode_candidates = {}  # {episode_key: [episode_objects]}
+        # Key format: (show_title, season, episode); the title (not the
+        # ratingKey) is what matches the same show across libraries
+        episode_candidates = defaultdict(list)  # {episode_key: [EpisodeRec]}
         
-        for show in shows:
+        def fetch_episodes(show):
+            # Snapshot the fields used later so distribution never touches
+            # the Plex objects (and can't trigger a lazy reload)
+            try:
+                return [EpisodeRec.from_episode(show.title, episode) for episode in show.episodes()]
+            except Exception as e:
+                logger.error("Error fetching episodes for %s: %s", show.title, e)
+                return None
+        
+        # Reuse episodes of shows that haven't changed since an earlier run
+        fetched = [None] * len(shows)
+        missing = []
+        with _episode_cache_lock:
+            for i, show in enumerate(shows):
+                entry = _episode_cache.get(self._episode_cache_key(show))
+                if entry is not None and entry[0] == self._episode_cache_version(show):
+                    fetched[i] = entry[1]
+                else:
+                    missing.append(i)
+        if len(missing) < len(shows):
+            logger.info("Reusing cached episodes for %s of %s shows", len(shows) - len(missing), len(shows))
+        
+        if missing:
+            missing_shows = [shows[i] for i in missing]
+            results = None
+            # A library listing only pays off once it replaces more than one
+            # round of per-show requests, and only while most of the shows it
+            # returns are ones still missing (not already cached)
+            if (sections and len(missing_shows) > self.fetch_workers
+                    and 2 * len(missing_shows) >= len(shows)):
+                results = self._list_section_episodes(missing_shows, sections, content_ratings,
+                                                      animation_only)
+            if results is None:
+                # Each show.episodes() is an independent round trip, so overlap them;
+                # map() yields in input order, keeping the result deterministic
+                with ThreadPoolExecutor(max_workers=min(self.fetch_workers, len(missing_shows))) as executor:
+                    results = list(executor.map(fetch_episodes, missing_shows))
+            
+            with _episode_cache_lock:
+                for i, show, episodes in zip(missing, missing_shows, results):
+                    fetched[i] = episodes
+                    if episodes is not None:
+                        _episode_cache[self._episode_cache_key(show)] = (
+                            self._episode_cache_version(show), episodes)
+        
+        # Keep only this run's shows; entries for deleted or filtered-out shows
+        # (or another server) would otherwise pin their Plex objects forever
+        current = {self._episode_cache_key(show) for show in shows}
+        with _episode_cache_lock:
+            for key in _episode_cache.keys() - current:
+                del _episode_cache[key]
+        
+        for show, episodes in zip(shows, fetched):
             try:
-                episodes = show.episodes()
                 if not episodes:
                     continue
                     
                 for episode in episodes:
                     # Create unique key for this episode
-                    season = f"S{episode.parentIndex:02d}" if episode.parentIndex else "S00"
-                    ep_num = f"E{episode.index:02d}" if episode.index else "E00"
-                    episode_key = f"{show.title}|{season}{ep_num}"
-                    
-                    if episode_key not in episode_candidates:
-                        episode_candidates[episode_key] = []
+                    episode_key = (show.title, episode.season or 0, episode.episode_num or 0)
                     episode_candidates[episode_key].append(episode)
                     
             except Exception as e:
-                logger.error(f"Error fetching episodes for {show.title}: {e}")
+                logger.error("Error reading episodes for %s: %s", show.title, e)
         
         # Second pass: select best quality version of each episode
-        show_episodes = {}
+        show_episodes = defaultdict(list)
         total_episodes = 0
         deduplication_stats = {'total_candidates': 0, 'duplicates_found': 0, 'selected': 0}
         
@@ -117,34 +345,96 @@ class PlaylistGenerator:
             
             if len(candidates) > 1:
                 deduplication_stats['duplicates_found'] += 1
-                logger.debug(f"Found {len(candidates)} versions of {episode_key}")
+                logger.debug("Found %d versions of %s S%02dE%02d", len(candidates), *episode_key)
             
-            # Select best quality episode
-            best_episode = self._select_best_episode(candidates)
+            # Select best quality episode (only duplicates need comparing)
+            best_episode = candidates[0] if len(candidates) == 1 else self._select_best_episode(candidates)
             deduplication_stats['selected'] += 1
             
-            # Extract show title from key
-            show_title = episode_key.split('|')[0]
-            
-            if show_title not in show_episodes:
-                show_episodes[show_title] = []
-            show_episodes[show_title].append(best_episode)
+            show_episodes[episode_key[0]].append(best_episode)
         
         # Sort episodes by air date within each show
-        for show_title in show_episodes:
-            show_episodes[show_title] = sorted(
-                show_episodes[show_title],
-                key=lambda ep: ep.originallyAvailableAt if ep.originallyAvailableAt else ep.addedAt
-            )
-            total_episodes += len(show_episodes[show_title])
-            logger.info(f"{show_title}: {len(show_episodes[show_title])} episodes")
-        
-        logger.info(f"Total episodes collected: {total_episodes}")
-        logger.info(f"Deduplication: {deduplication_stats['total_candidates']} candidates, "
-                   f"{deduplication_stats['duplicates_found']} duplicates found, "
-                   f"{deduplication_stats['selected']} unique episodes selected")
-        
-        return show_episodes
+        for show_title, episodes in show_episodes.items():
+            episodes.sort(key=by_air_date)
+            total_episodes += len(episodes)
+            logger.info("%s: %s episodes", show_title, len(episodes))
+        
+        logger.info("Total episodes collected: %s", total_episodes)
+        logger.info("Deduplication: %s candidates, %s duplicates found, %s unique episodes selected",
+                    deduplication_stats['total_candidates'], deduplication_stats['duplicates_found'],
+                    deduplication_stats['selected'])
+        
+        return dict(show_episodes)
+    
+    def _list_section_episodes(self, shows, sections, content_ratings=None, animation_only=False):
+        """
+        Fetch the shows' episodes with one paged episode listing per library
+        
+        Library listings carry the media and part details used to pick the
+        best copy, so this replaces a request per show with a few pages
+        per library.
+        
+        Args:
+            shows: Show objects to collect episodes for
+            sections: Library sections the shows came from
+            content_ratings: Show ratings to narrow the listing by on the server
+            animation_only: Also narrow the listing to the animation genres
+        
+        Returns:
+            list: [EpisodeRec] per show, aligned with shows, or None if the
+                  server rejects the listing or can't narrow it to the animation
+                  genres (callers fall back to per-show fetches)
+        """
+        wanted = {show.ratingKey for show in shows}
+        by_show = {}
+        try:
+            for section in sections:
+                filters = {}
+                if content_ratings:
+                    ratings = self._rating_choices(section, content_ratings)
+                    if ratings is not None and not ratings:
+                        continue  # none of its shows can carry a selected rating
+                    filters['show.contentRating'] = ratings if ratings is not None else list(content_ratings)
+                if animation_only:
+                    genres = self._animation_genres(section)
+                    if genres is None:
+                        # Unfiltered by genre the listing would cover every
+                        # rated show in the library, not just the cartoons
+                        logger.debug("Genre filter unavailable for '%s', fetching per show", section.title)
+                        return None
+                    if not genres:
+                        continue
+                    filters['show.genre'] = genres
+                for episode in self._search_pages(section, libtype='episode', filters=filters or None):
+                    # The rating filter is only a narrowing hint; membership
+                    # in the already-filtered shows is what decides
+                    if episode.grandparentRatingKey in wanted:
+                        by_show.setdefault(episode.grandparentRatingKey, []).append(episode)
+        except (BadRequest, NotFound) as e:
+            logger.warning("Bulk episode listing unavailable, fetching per show: %s", e)
+            return None
+        
+        fetched = []
+        for show in shows:
+            episodes = [EpisodeRec.from_episode(show.title, episode)
+                        for episode in by_show.get(show.ratingKey, [])]
+            # Same order show.episodes() returns
+            episodes.sort(key=lambda ep: (ep.season or 0, ep.episode_num or 0))
+            fetched.append(episodes)
+        logger.info("Listed %s episodes from %s libraries", sum(map(len, fetched)), len(sections))
+        return fetched
+    
+    def _episode_cache_key(self, show):
+        """Identify a show's cached episodes by server and rating key"""
+        return (self.plex.machineIdentifier, show.ratingKey)
+    
+    @staticmethod
+    def _episode_cache_version(show):
+        """
+        Episode count and last update from the show listing; adding,
+        removing or refreshing episodes changes it and forces a re-fetch
+        """
+        return (show.leafCount, show.updatedAt)
     
     def _select_best_episode(self, candidates):
         """
@@ -152,199 +442,226 @@ class PlaylistGenerator:
         Priority: Highest bitrate > Largest filesize > Random
         
         Args:
-            candidates: List of Episode objects
+            candidates: List of EpisodeRec
         
         Returns:
-            Episode: The best quality episode
+            EpisodeRec: The best quality episode
         """
-        import random
-        
         if len(candidates) == 1:
             return candidates[0]
         
-        # Get quality metrics for each candidate
-        candidates_with_metrics = []
-        for ep in candidates:
+        # (bitrate, filesize, rec) tuples, in candidate order
+        metrics = []
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for rec in candidates:
+            ep = rec.episode
             try:
                 # Get media info
                 media = ep.media[0] if ep.media else None
-                bitrate = media.bitrate if media and hasattr(media, 'bitrate') else 0
+                bitrate = getattr(media, 'bitrate', 0)
                 
                 # Get file size
-                parts = media.parts if media and hasattr(media, 'parts') else []
-                filesize = parts[0].size if parts and hasattr(parts[0], 'size') else 0
+                parts = getattr(media, 'parts', None)
+                filesize = getattr(parts[0], 'size', 0) if parts else 0
                 
-                candidates_with_metrics.append({
-                    'episode': ep,
-                    'bitrate': bitrate or 0,
-                    'filesize': filesize or 0
-                })
+                metrics.append((bitrate or 0, filesize or 0, rec))
                 
-                logger.debug(f"  {ep.grandparentTitle} {ep.seasonEpisode}: "
-                           f"bitrate={bitrate}, size={filesize}")
+                if debug:
+                    logger.debug("  %s %s: bitrate=%s, size=%s",
+                                 ep.grandparentTitle, ep.seasonEpisode, bitrate, filesize)
             except Exception as e:
-                logger.warning(f"Error getting metrics for episode: {e}")
-                candidates_with_metrics.append({
-                    'episode': ep,
-                    'bitrate': 0,
-                    'filesize': 0
-                })
-        
-        # Sort by bitrate (descending), then filesize (descending)
-        candidates_with_metrics.sort(
-            key=lambda x: (x['bitrate'], x['filesize']),
-            reverse=True
-        )
+                logger.warning("Error getting metrics for episode: %s", e)
+                metrics.append((0, 0, rec))
+        
+        # Highest bitrate, then largest filesize, in one pass
+        best_bitrate, best_filesize = max((m[0], m[1]) for m in metrics)
         
         # Check if top candidates have same quality
-        best = candidates_with_metrics[0]
-        ties = [c for c in candidates_with_metrics 
-                if c['bitrate'] == best['bitrate'] and c['filesize'] == best['filesize']]
+        ties = [rec for bitrate, filesize, rec in metrics
+                if bitrate == best_bitrate and filesize == best_filesize]
         
         if len(ties) > 1:
-            logger.debug(f"  Quality tie between {len(ties)} versions, selecting randomly")
-            selected = random.choice(ties)
-        else:
-            selected = best
-            logger.debug(f"  Selected version: bitrate={selected['bitrate']}, "
-                       f"size={selected['filesize']}")
-        
-        return selected['episode']
+            logger.debug("  Quality tie between %d versions, selecting randomly", len(ties))
+            return random.choice(ties)
+        
+        logger.debug("  Selected version: bitrate=%s, size=%s", best_bitrate, best_filesize)
+        return ties[0]
     
-    def distribute_episodes_to_weeks(self, show_episodes, weeks_per_year=52):
+    def iter_weeks(self, show_episodes, weeks_per_year=52):
         """
-        Distribute episodes across weeks in a round-robin fashion
-        Each week gets one episode from each show (if available)
+        Distribute episodes across weeks in a round-robin fashion, one week
+        at a time. Each week gets one episode from each show (if available)
         
         Args:
-            show_episodes: Dict of {show_title: [episodes]}
-            weeks_per_year: Number of weeks to create (default 52)
+            show_episodes: Dict of {show_title: [EpisodeRec]} from get_all_episodes()
+            weeks_per_year: Number of weeks per year (only used for logging)
         
-        Returns:
-            dict: {year: {week: [episodes]}}
+        Yields:
+            list: Each week's [EpisodeRec], in week order
         """
         logger.info("Distributing episodes across weeks...")
         
-        # Track episode index for each show
-        show_indices = {show: 0 for show in show_episodes.keys()}
-        
-        # Track which shows still have episodes available
-        active_shows = set(show_episodes.keys())
+        # Round-robin is pure indexing: a show's n-th episode lands in week n.
+        # Picking from the shows in sorted title order gives every week a
+        # consistent order before the (stable) air date sort
+        order = [show_episodes[title] for title in sorted(show_episodes.keys())]
+        total_weeks = max(map(len, order), default=0)
         
-        # Structure: {year: {week: [episodes]}}
-        yearly_playlists = defaultdict(lambda: defaultdict(list))
-        
-        year = 1
-        week = 1
-        
-        while active_shows:
-            # For this week, add one episode from each active show
-            week_episodes = []
-            
-            for show_title in sorted(active_shows):  # Sort for consistent ordering
-                episodes = show_episodes[show_title]
-                current_index = show_indices[show_title]
-                
-                if current_index < len(episodes):
-                    episode = episodes[current_index]
-                    week_episodes.append({
-                        'show': show_title,
-                        'episode': episode,
-                        'season': episode.parentIndex,
-                        'episode_num': episode.index,
-                        'title': episode.title
-                    })
-                    show_indices[show_title] += 1
-                else:
-                    # This show has no more episodes
-                    active_shows.discard(show_title)
+        for idx in range(total_weeks):
+            week_episodes = [episodes[idx] for episodes in order if idx < len(episodes)]
             
             # Sort week episodes by air date (oldest first)
-            if week_episodes:
-                week_episodes.sort(
-                    key=lambda ep: ep['episode'].originallyAvailableAt if ep['episode'].originallyAvailableAt else ep['episode'].addedAt
-                )
-                yearly_playlists[year][week] = week_episodes
-                logger.debug(f"Year {year}, Week {week}: {len(week_episodes)} episodes")
-            
-            week += 1
+            week_episodes.sort(key=by_air_date)
             
-            # Move to next year after 52 weeks
-            if week > weeks_per_year:
-                if not active_shows:
-                    break
-                logger.info(f"Completed Year {year} with {weeks_per_year} weeks")
-                year += 1
-                week = 1
+            year, week = divmod(idx, weeks_per_year)
+            logger.debug("Year %d, Week %d: %d episodes", year + 1, week + 1, len(week_episodes))
+            if week + 1 == weeks_per_year and idx + 1 < total_weeks:
+                logger.info("Completed Year %s with %s weeks", year + 1, weeks_per_year)
+            yield week_episodes
+    
+    def distribute_episodes_to_weeks(self, show_episodes, weeks_per_year=52):
+        """
+        Distribute episodes across weeks in a round-robin fashion
+        Each week gets one episode from each show (if available)
         
-        logger.info(f"Created {year} years of playlists")
-        return dict(yearly_playlists)
+        Args:
+            show_episodes: Dict of {show_title: [EpisodeRec]} from get_all_episodes()
+            weeks_per_year: Number of weeks to create (default 52)
+        
+        Returns:
+            WeekSchedule: Flat list of weekly [EpisodeRec] lists
+        """
+        schedule = WeekSchedule(weeks_per_year, list(self.iter_weeks(show_episodes, weeks_per_year)))
+        logger.info("Created %s years of playlists", schedule.years)
+        return schedule
     
-    def create_plex_playlists(self, yearly_playlists, playlist_prefix="Saturday Morning"):
+    def create_plex_playlists(self, schedule, playlist_prefix="Saturday Morning"):
         """
         Create actual Plex playlists from the generated structure
         
         Args:
-            yearly_playlists: Dict from distribute_episodes_to_weeks()
+            schedule: WeekSchedule from distribute_episodes_to_weeks()
             playlist_prefix: Prefix for playlist names
         
         Returns:
             list: Created playlist objects
         """
+        created_playlists = list(self.iter_plex_playlists(schedule.weeks, playlist_prefix,
+                                                          schedule.weeks_per_year))
+        logger.info("Successfully created %s playlists", len(created_playlists))
+        return created_playlists
+    
+    def iter_plex_playlists(self, weeks, playlist_prefix="Saturday Morning", weeks_per_year=52):
+        """
+        Create Plex playlists for each week, several in flight at once
+        
+        Args:
+            weeks: Iterable of weekly [EpisodeRec] lists, e.g. from iter_weeks();
+                consumed lazily, so only the weeks in flight are held
+            playlist_prefix: Prefix for playlist names
+            weeks_per_year: Weeks per year, for naming
+        
+        Yields:
+            Playlist: Each playlist as soon as it has been created
+        """
         logger.info("Creating Plex playlists...")
-        created_playlists = []
         
-        for year, weeks in yearly_playlists.items():
-            for week, episode_data in weeks.items():
-                if not episode_data:
-                    continue
+        # One listing up front instead of a lookup (usually a 404) per week
+        existing_by_title = {p.title: p for p in self._find_playlists(playlist_prefix)}
+        
+        def create_one(idx, episode_data):
+            if not episode_data:
+                return None
+            
+            # Extract episode objects
+            episodes = list(map(attrgetter('episode'), episode_data))
+            
+            # Create playlist name
+            year, week = divmod(idx, weeks_per_year)
+            year, week = year + 1, week + 1
+            playlist_title = f"{playlist_prefix} - Year {year} Week {week:02d}"
+            
+            try:
+                existing = existing_by_title.pop(playlist_title, None)
+                if existing is not None:
+                    updated = self._update_playlist(existing, episodes)
+                    if updated is not None:
+                        return updated
+                    
+                    logger.info("Deleting existing playlist '%s'...", playlist_title)
+                    existing.delete()
                 
-                # Extract episode objects
-                episodes = [ep['episode'] for ep in episode_data]
+                # Create new playlist
+                playlist = Playlist.create(
+                    server=self.plex,
+                    title=playlist_title,
+                    items=episodes
+                )
                 
-                # Create playlist name
-                playlist_title = f"{playlist_prefix} - Year {year} Week {week:02d}"
+                logger.info("Created: %s (%s episodes)", playlist_title, len(episodes))
+                return playlist
                 
-                try:
-                    # Check if playlist already exists
-                    existing = None
-                    should_replace = False
-                    try:
-                        existing = self.plex.playlist(playlist_title)
-                        existing_count = len(existing.items())
-                        expected_count = len(episodes)
-                        
-                        if existing_count != expected_count:
-                            logger.warning(f"Playlist '{playlist_title}' exists but is incomplete: "
-                                         f"{existing_count} episodes (expected {expected_count})")
-                            should_replace = True
-                        else:
-                            logger.info(f"Playlist '{playlist_title}' already exists with correct episode count ({existing_count})")
-                            should_replace = True  # Replace anyway to ensure fresh content
-                        
-                        if should_replace:
-                            logger.info(f"Deleting existing playlist '{playlist_title}'...")
-                            existing.delete()
-                    except:
-                        # Playlist doesn't exist, which is fine
-                        pass
-                    
-                    # Create new playlist
-                    from plexapi.playlist import Playlist
-                    playlist = Playlist.create(
-                        server=self.plex,
-                        title=playlist_title,
-                        items=episodes
-                    )
-                    
-                    created_playlists.append(playlist)
-                    logger.info(f"Created: {playlist_title} ({len(episodes)} episodes)")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to create playlist '{playlist_title}': {e}")
+            except Exception as e:
+                logger.error("Failed to create playlist '%s': %s", playlist_title, e)
+                return None
+        
+        # Weeks are independent, so overlap their Plex round trips while
+        # yielding in week order. Only a bounded window of weeks is pulled
+        # ahead; closing the generator early (a cancelled job) drops the
+        # weeks that haven't started yet.
+        executor = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        pending = deque()
+        try:
+            for idx, episode_data in enumerate(weeks):
+                pending.append(executor.submit(create_one, idx, episode_data))
+                if len(pending) >= 2 * self.fetch_workers:
+                    playlist = pending.popleft().result()
+                    if playlist is not None:
+                        yield playlist
+            while pending:
+                playlist = pending.popleft().result()
+                if playlist is not None:
+                    yield playlist
+        finally:
+            executor.shutdown(cancel_futures=True)
+    
+    def _update_playlist(self, playlist, episodes):
+        """
+        Bring an existing playlist in line with the week's episodes in place,
+        keeping its identity (and any client references to it)
         
-        logger.info(f"Successfully created {len(created_playlists)} playlists")
-        return created_playlists
+        Args:
+            playlist: Existing Playlist with the week's title
+            episodes: Episode objects the playlist should contain, in order
+        
+        Returns:
+            Playlist: The updated playlist, or None if it has to be recreated
+        """
+        current = playlist.items()
+        current_keys = [item.ratingKey for item in current]
+        wanted_keys = [ep.ratingKey for ep in episodes]
+        
+        if current_keys == wanted_keys:
+            logger.info("Playlist '%s' already up to date (%s episodes)", playlist.title, len(current_keys))
+            return playlist
+        
+        # Removing and appending can't reorder what stays, so only patch
+        # when the kept items followed by the new ones give the wanted order
+        wanted = set(wanted_keys)
+        existing = set(current_keys)
+        to_remove = [item for item in current if item.ratingKey not in wanted]
+        to_add = [ep for ep in episodes if ep.ratingKey not in existing]
+        kept_keys = [key for key in current_keys if key in wanted]
+        if kept_keys + [ep.ratingKey for ep in to_add] != wanted_keys:
+            logger.info("Playlist '%s' order changed, recreating", playlist.title)
+            return None
+        
+        if to_remove:
+            playlist.removeItems(to_remove)
+        if to_add:
+            playlist.addItems(to_add)
+        logger.info("Updated: %s (-%s +%s episodes)", playlist.title, len(to_remove), len(to_add))
+        return playlist
     
     def generate_all_playlists(self, tv_section_name, content_ratings, 
                                playlist_prefix="Saturday Morning", 
@@ -363,13 +680,32 @@ class PlaylistGenerator:
         Returns:
             dict: Summary of operation
         """
+        for event in self.iter_generate_playlists(tv_section_name, content_ratings,
+                                                  playlist_prefix, weeks_per_year,
+                                                  animation_only):
+            if event['event'] == 'result':
+                return event['result']
+    
+    def iter_generate_playlists(self, tv_section_name, content_ratings,
+                                playlist_prefix="Saturday Morning",
+                                weeks_per_year=52,
+                                animation_only=False):
+        """
+        Complete workflow as a stream of progress events
+        
+        Takes the same arguments as generate_all_playlists().
+        
+        Yields:
+            dict: {'event': 'playlist', 'title': ..., 'created': n} after each
+                  playlist is created, then a final {'event': 'result', 'result': summary}
+        """
         logger.info("="*60)
         logger.info("Starting playlist generation workflow")
-        logger.info(f"TV Section: {tv_section_name}")
-        logger.info(f"Content Ratings: {content_ratings}")
-        logger.info(f"Playlist Prefix: {playlist_prefix}")
-        logger.info(f"Weeks per Year: {weeks_per_year}")
-        logger.info(f"Animation Only: {animation_only}")
+        logger.info("TV Section: %s", tv_section_name)
+        logger.info("Content Ratings: %s", content_ratings)
+        logger.info("Playlist Prefix: %s", playlist_prefix)
+        logger.info("Weeks per Year: %s", weeks_per_year)
+        logger.info("Animation Only: %s", animation_only)
         logger.info("="*60)
         
         try:
@@ -381,119 +717,142 @@ class PlaylistGenerator:
             
             # Collect shows from all libraries
             all_shows = []
+            sections = []
             for lib_name in library_names:
-                logger.debug(f"Fetching TV section: {lib_name}")
+                logger.debug("Fetching TV section: %s", lib_name)
                 tv_section = self.plex.library.section(lib_name)
                 shows = self.get_filtered_shows(tv_section, content_ratings, animation_only)
                 all_shows.extend(shows)
-                logger.info(f"Found {len(shows)} shows in '{lib_name}'")
+                if shows:
+                    sections.append(tv_section)
+                logger.info("Found %s shows in '%s'", len(shows), lib_name)
             
             if not all_shows:
                 logger.warning("No shows found matching criteria!")
-                return {
+                yield {'event': 'result', 'result': {
                     'success': False,
                     'error': f'No shows found with ratings: {content_ratings}'
-                }
+                }}
+                return
             
             # Create show rating mapping
             show_ratings = {show.title: show.contentRating for show in all_shows}
             
             # Get all episodes
             logger.info("Collecting episodes from shows...")
-            show_episodes = self.get_all_episodes(all_shows)
+            show_episodes = self.get_all_episodes(all_shows, sections, content_ratings, animation_only)
             
             if not show_episodes:
                 logger.error("No episodes found in selected shows")
-                return {
+                yield {'event': 'result', 'result': {
                     'success': False,
                     'error': 'No episodes found in selected shows'
-                }
+                }}
+                return
+            
+            # Distribute episodes to weeks and create each week's Plex
+            # playlist as it is produced, reporting each one as it lands
+            week_count = 0
+            total_episodes = 0
             
-            # Distribute episodes to weeks
-            yearly_playlists = self.distribute_episodes_to_weeks(
-                show_episodes, 
-                weeks_per_year
-            )
+            def counted(weeks):
+                nonlocal week_count, total_episodes
+                for week_episodes in weeks:
+                    week_count += 1
+                    total_episodes += len(week_episodes)
+                    yield week_episodes
             
-            # Create Plex playlists
-            created_playlists = self.create_plex_playlists(
-                yearly_playlists, 
-                playlist_prefix
-            )
+            created_playlists = []
+            weeks = counted(self.iter_weeks(show_episodes, weeks_per_year))
+            for playlist in self.iter_plex_playlists(weeks, playlist_prefix, weeks_per_year):
+                created_playlists.append(playlist)
+                yield {'event': 'playlist', 'title': playlist.title, 'created': len(created_playlists)}
+            logger.info("Successfully created %s playlists", len(created_playlists))
             
             # Calculate comprehensive statistics
-            total_episodes = sum(
-                len(week_eps) 
-                for year_data in yearly_playlists.values() 
-                for week_eps in year_data.values()
-            )
+            years = -(-week_count // weeks_per_year)
             
-            # Calculate total duration
+            # Episode counts, rating breakdown and total duration in one pass
             total_duration_ms = 0
             episodes_per_show = {}
-            rating_breakdown = {}
+            rating_breakdown = Counter()
             
             for show_title, episodes in show_episodes.items():
-                episodes_per_show[show_title] = len(episodes)
+                ep_count = len(episodes)
+                episodes_per_show[show_title] = ep_count
                 rating = show_ratings.get(show_title, 'Unknown')
-                # Count each show's episodes under its rating
-                rating_breakdown[rating] = rating_breakdown.get(rating, 0) + len(episodes)
-                # Add up duration
-                for ep in episodes:
-                    total_duration_ms += ep.duration or 0
+                rating_breakdown[rating] += ep_count
+                total_duration_ms += sum(map(episode_duration, episodes))
             
             total_duration_hours = (total_duration_ms / 1000 / 60 / 60)
-            avg_episodes_per_show = sum(episodes_per_show.values()) / len(episodes_per_show) if episodes_per_show else 0
+            avg_episodes_per_show = total_episodes / len(episodes_per_show) if episodes_per_show else 0
             
             # Year range
-            year_numbers = sorted(yearly_playlists.keys())
-            year_range = f"{year_numbers[0]}-{year_numbers[-1]}" if len(year_numbers) > 1 else str(year_numbers[0])
+            year_range = f"1-{years}" if years > 1 else "1"
             
             logger.info("="*60)
             logger.info("PLAYLIST GENERATION COMPLETE")
             logger.info("="*60)
-            logger.info(f"Shows Processed: {len(all_shows)}")
-            logger.info(f"Total Episodes Distributed: {total_episodes}")
-            logger.info(f"Average Episodes per Show: {avg_episodes_per_show:.1f}")
-            logger.info(f"Total Runtime: {total_duration_hours:.1f} hours ({total_duration_hours/24:.1f} days)")
-            logger.info(f"Years Generated: {len(yearly_playlists)} ({year_range})")
-            logger.info(f"Playlists Created: {len(created_playlists)}")
-            logger.info(f"Average Episodes per Playlist: {total_episodes/len(created_playlists):.1f}")
+            logger.info("Shows Processed: %s", len(all_shows))
+            logger.info("Total Episodes Distributed: %s", total_episodes)
+            logger.info("Average Episodes per Show: %.1f", avg_episodes_per_show)
+            logger.info("Total Runtime: %.1f hours (%.1f days)", total_duration_hours, total_duration_hours/24)
+            logger.info("Years Generated: %s (%s)", years, year_range)
+            logger.info("Playlists Created: %s", len(created_playlists))
+            logger.info("Average Episodes per Playlist: %.1f", total_episodes/len(created_playlists))
             logger.info("")
             logger.info("Content Rating Breakdown:")
-            for rating in sorted(rating_breakdown.keys()):
-                count = rating_breakdown[rating]
+            for rating, count in sorted(rating_breakdown.items()):
                 percentage = (count / total_episodes) * 100
-                logger.info(f"  {rating}: {count} episodes ({percentage:.1f}%)")
+                logger.info("  %s: %s episodes (%.1f%%)", rating, count, percentage)
             logger.info("")
             logger.info("Top 10 Shows by Episode Count:")
-            top_shows = sorted(episodes_per_show.items(), key=lambda x: x[1], reverse=True)[:10]
+            top_shows = nlargest(10, episodes_per_show.items(), key=itemgetter(1))
             for show_name, ep_count in top_shows:
-                logger.info(f"  {show_name}: {ep_count} episodes")
+                logger.info("  %s: %s episodes", show_name, ep_count)
             logger.info("="*60)
             
-            return {
+            yield {'event': 'result', 'result': {
                 'success': True,
                 'shows_count': len(all_shows),
                 'shows': [s.title for s in all_shows],
                 'total_episodes': total_episodes,
                 'total_duration_hours': round(total_duration_hours, 1),
                 'avg_episodes_per_show': round(avg_episodes_per_show, 1),
-                'years_generated': len(yearly_playlists),
+                'years_generated': years,
                 'year_range': year_range,
                 'playlists_created': len(created_playlists),
                 'avg_episodes_per_playlist': round(total_episodes/len(created_playlists), 1),
                 'rating_breakdown': rating_breakdown,
                 'top_shows': dict(top_shows),
                 'playlist_names': [p.title for p in created_playlists[:10]]  # First 10
-            }
+            }}
             
         except Exception as e:
-            logger.error(f"Failed to generate playlists: {e}", exc_info=True)
-            return {
+            logger.error("Failed to generate playlists: %s", e, exc_info=True)
+            yield {'event': 'result', 'result': {
                 'success': False,
                 'error': str(e)
-            }
+            }}
+    
+    def _find_playlists(self, playlist_prefix):
+        """
+        List the playlists whose title starts with the prefix
+        
+        The server narrows the listing with its partial title match and
+        plexapi applies the exact prefix check to what comes back.
+        
+        Args:
+            playlist_prefix: Playlist title prefix
+        
+        Returns:
+            list: Matching Playlist objects
+        """
+        try:
+            return self.plex.playlists(title=playlist_prefix, title__startswith=playlist_prefix)
+        except BadRequest as e:
+            logger.warning("Server-side playlist title filter failed, listing all playlists: %s", e)
+            return [p for p in self.plex.playlists() if p.title.startswith(playlist_prefix)]
     
     def get_playlist_summary(self, playlist_prefix="Saturday Morning"):
         """
@@ -505,12 +864,11 @@ class PlaylistGenerator:
         Returns:
             dict: Summary of existing playlists
         """
-        logger.debug(f"Getting playlist summary for prefix: {playlist_prefix}")
+        logger.debug("Getting playlist summary for prefix: %s", playlist_prefix)
         try:
-            all_playlists = self.plex.playlists()
-            matching = [p for p in all_playlists if p.title.startswith(playlist_prefix)]
+            matching = self._find_playlists(playlist_prefix)
             
-            logger.info(f"Found {len(matching)} playlists with prefix '{playlist_prefix}'")
+            logger.info("Found %s playlists with prefix '%s'", len(matching), playlist_prefix)
             
             return {
                 'success': True,
@@ -525,7 +883,7 @@ class PlaylistGenerator:
                 ]
             }
         except Exception as e:
-            logger.error(f"Failed to get playlist summary: {e}", exc_info=True)
+            logger.error("Failed to get playlist summary: %s", e, exc_info=True)
             return {
                 'success': False,
                 'error': str(e)
@@ -541,22 +899,25 @@ class PlaylistGenerator:
         Returns:
             dict: Summary of deletion
         """
-        logger.info(f"Deleting all playlists with prefix: {playlist_prefix}")
+        logger.info("Deleting all playlists with prefix: %s", playlist_prefix)
         try:
-            all_playlists = self.plex.playlists()
-            matching = [p for p in all_playlists if p.title.startswith(playlist_prefix)]
+            matching = self._find_playlists(playlist_prefix)
             
-            logger.debug(f"Found {len(matching)} playlists to delete")
-            deleted_count = 0
-            for playlist in matching:
+            logger.debug("Found %d playlists to delete", len(matching))
+            
+            def delete_one(playlist):
                 try:
                     playlist.delete()
-                    deleted_count += 1
-                    logger.info(f"Deleted: {playlist.title}")
+                    logger.info("Deleted: %s", playlist.title)
+                    return True
                 except Exception as e:
-                    logger.error(f"Failed to delete {playlist.title}: {e}")
+                    logger.error("Failed to delete %s: %s", playlist.title, e)
+                    return False
+            
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+                deleted_count = sum(executor.map(delete_one, matching))
             
-            logger.info(f"Deletion complete: {deleted_count}/{len(matching)} playlists deleted")
+            logger.info("Deletion complete: %s/%s playlists deleted", deleted_count, len(matching))
             
             return {
                 'success': True,
@@ -564,7 +925,7 @@ class PlaylistGenerator:
                 'total_found': len(matching)
             }
         except Exception as e:
-            logger.error(f"Failed to delete playlists: {e}", exc_info=True)
+            logger.error("Failed to delete playlists: %s", e, exc_info=True)
             return {
                 'success': False,
                 'error': str(e)
@@ -2,21 +2,78 @@
 Plex connection and authentication module for SaturdayMorningPlex
 """
 import logging
+import time
+import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from plexapi.server import PlexServer
 from plexapi.myplex import MyPlexAccount
-from plexapi.exceptions import BadRequest, Unauthorized
+from plexapi.exceptions import NotFound, PlexApiException, Unauthorized
 
 # Disable SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying with backoff (rate limited or briefly unavailable)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Seconds to reuse the MyPlex resource list before asking plex.tv again
+RESOURCES_TTL = 300
+
+# MyPlex resource products that are Plex servers (players and clients are skipped)
+SERVER_PRODUCTS = frozenset({'Plex Media Server'})
+
+
+def create_session(pool_connections=10, pool_maxsize=20, verify=False):
+    """
+    Build a requests session with a keep-alive connection pool
+    
+    Sharing one session across PlexConnection instances lets repeated
+    connects and API calls reuse warm TCP/TLS connections.
+    
+    Args:
+        pool_connections: Number of host pools to keep
+        pool_maxsize: Connections kept per host (at least the worker thread count)
+        verify: Verify SSL certificates (off by default for self-signed local servers)
+    
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    session.verify = verify
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            # Only retry on transient overload/proxy statuses; connection errors
+            # and read timeouts fail at once instead of multiplying the timeout
+            total=None,
+            connect=0,
+            read=False,
+            other=0,
+            status=3,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUSES,
+            # Once retries run out the last response is returned, so plexapi
+            # still raises its usual errors
+            raise_on_status=False
+        )
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 
 class PlexConnection:
     """Handles Plex server connections and authentication"""
     
-    def __init__(self, baseurl=None, token=None, username=None, password=None, servername=None):
+    __slots__ = ('baseurl', 'token', 'username', 'password', 'servername', 'session',
+                 'plex', '_account', '_resources', '_resources_ts')
+    
+    def __init__(self, baseurl=None, token=None, username=None, password=None, servername=None,
+                 session=None):
         """
         Initialize Plex connection
         
@@ -26,14 +83,64 @@ class PlexConnection:
             username: MyPlex username (for remote connection)
             password: MyPlex password (for remote connection)
             servername: Name of the Plex server (required if using username/password)
+            session: Optional shared requests.Session (direct connections create a pooled one if omitted)
         """
         self.baseurl = baseurl
         self.token = token
         self.username = username
         self.password = password
         self.servername = servername
+        self.session = session
         self.plex = None
         self._account = None
+        self._resources = None
+        self._resources_ts = 0
+    
+    def _myplex_session(self):
+        """
+        Pooled session for MyPlex sign-in and the server connections it hands out
+        
+        The shared session is reused only when it verifies certificates;
+        credentials sent to plex.tv never go over an unverified connection.
+        
+        Returns:
+            requests.Session
+        """
+        if self.session is not None and self.session.verify:
+            return self.session
+        return create_session(verify=True)
+    
+    def _get_resources(self):
+        """
+        MyPlex resources, fetched from plex.tv at most once per RESOURCES_TTL
+        
+        Returns:
+            list: MyPlexResource objects for the signed-in account
+        """
+        now = time.monotonic()
+        if self._resources is None or now - self._resources_ts >= RESOURCES_TTL:
+            self._resources = self._account.resources()
+            self._resources_ts = now
+        return self._resources
+    
+    def _find_resource(self, name):
+        """
+        Find a MyPlex resource by name or machine identifier in the cached list
+        
+        Args:
+            name: Server name (case-insensitive) or client identifier
+        
+        Returns:
+            MyPlexResource
+        
+        Raises:
+            NotFound: If no resource matches
+        """
+        lowered = name.lower()
+        for resource in self._get_resources():
+            if resource.name.lower() == lowered or resource.clientIdentifier == name:
+                return resource
+        raise NotFound(f'Unable to find resource {name}')
     
     def connect(self):
         """
@@ -49,36 +156,36 @@ class PlexConnection:
         try:
             # Method 1: Direct connection with baseurl and token
             if self.baseurl and self.token:
-                logger.info(f"Connecting to Plex server at {self.baseurl}")
-                # Create session with SSL verification disabled for local HTTPS connections
-                session = None
-                if self.baseurl.startswith('https://'):
-                    import requests
-                    session = requests.Session()
-                    session.verify = False
-                    logger.debug("SSL verification disabled for HTTPS connection")
+                logger.info("Connecting to Plex server at %s", self.baseurl)
+                # Without a shared session, build a pooled one (SSL verification
+                # disabled for local HTTPS) and keep it for reconnects
+                if self.session is None:
+                    self.session = create_session()
+                    logger.debug("Created pooled session (SSL verification disabled)")
                 
-                self.plex = PlexServer(self.baseurl, self.token, session=session)
-                logger.info(f"Connected to Plex server: {self.plex.friendlyName}")
+                self.plex = PlexServer(self.baseurl, self.token, session=self.session)
+                logger.info("Connected to Plex server: %s", self.plex.friendlyName)
                 return self.plex
             
             # Method 2: MyPlex account connection
             elif self.username and self.password:
-                logger.info(f"Logging into MyPlex account: {self.username}")
-                self._account = MyPlexAccount(self.username, self.password)
+                logger.info("Logging into MyPlex account: %s", self.username)
+                self._account = MyPlexAccount(self.username, self.password,
+                                              session=self._myplex_session())
+                self._resources = None  # new sign-in, fetch its resources afresh
                 
                 if not self.servername:
                     # List available servers
-                    resources = self._account.resources()
-                    server_names = [r.name for r in resources if r.product == 'Plex Media Server']
+                    resources = self._get_resources()
+                    server_names = [r.name for r in resources if r.product in SERVER_PRODUCTS]
                     raise ValueError(
                         f"Server name required. Available servers: {', '.join(server_names)}"
                     )
                 
-                logger.info(f"Connecting to server: {self.servername}")
-                resource = self._account.resource(self.servername)
+                logger.info("Connecting to server: %s", self.servername)
+                resource = self._find_resource(self.servername)
                 self.plex = resource.connect()
-                logger.info(f"Connected to Plex server: {self.plex.friendlyName}")
+                logger.info("Connected to Plex server: %s", self.plex.friendlyName)
                 return self.plex
             
             else:
@@ -89,10 +196,10 @@ class PlexConnection:
                 )
         
         except Unauthorized as e:
-            logger.error(f"Authentication failed: {e}")
+            logger.error("Authentication failed: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Failed to connect to Plex server: {e}")
+            logger.error("Failed to connect to Plex server: %s", e)
             raise
     
     def test_connection(self):
@@ -108,7 +215,7 @@ class PlexConnection:
                 self.connect()
             
             sections = [section.title for section in self.plex.library.sections()]
-            logger.info(f"Connection test successful: {self.plex.friendlyName} ({len(sections)} sections)")
+            logger.info("Connection test successful: %s (%d sections)", self.plex.friendlyName, len(sections))
             
             return {
                 'success': True,
@@ -118,8 +225,16 @@ class PlexConnection:
                 'platform_version': self.plex.platformVersion,
                 'library_sections': sections
             }
+        except (PlexApiException, requests.RequestException, ValueError) as e:
+            # Bad credentials, unreachable server or missing parameters;
+            # connect() has already logged the cause
+            logger.warning("Connection test failed: %s", e)
+            return {
+                'success': False,
+                'error': str(e)
+            }
         except Exception as e:
-            logger.error(f"Connection test failed: {e}", exc_info=True)
+            logger.error("Connection test failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 'success': False,
                 'error': str(e)
@@ -138,18 +253,18 @@ class PlexConnection:
         if not self.plex:
             self.connect()
         
-        logger.debug(f"Fetching TV section: {section_name}")
+        logger.debug("Fetching TV section: %s", section_name)
         try:
             section = self.plex.library.section(section_name)
-            logger.info(f"Found TV section: {section_name}")
+            logger.info("Found TV section: %s", section_name)
             return section
         except Exception as e:
-            logger.error(f"Failed to get TV section '{section_name}': {e}")
+            logger.error("Failed to get TV section '%s': %s", section_name, e)
             logger.debug("Attempting to find any TV section as fallback")
             # Try to find any TV section
             for section in self.plex.library.sections():
                 if section.type == 'show':
-                    logger.info(f"Found TV section: {section.title}")
+                    logger.info("Found TV section: %s", section.title)
                     return section
             raise ValueError(f"No TV library section found. Available sections: "
                            f"{[s.title for s in self.plex.library.sections()]}")
@@ -166,9 +281,10 @@ class PlexConnection:
             if not (self.username and self.password):
                 raise ValueError("MyPlex username and password required")
             logger.info("Logging into MyPlex to get server list")
-            self._account = MyPlexAccount(self.username, self.password)
+            self._account = MyPlexAccount(self.username, self.password,
+                                          session=self._myplex_session())
         
-        resources = self._account.resources()
+        resources = self._get_resources()
         servers = [
             {
                 'name': r.name,
@@ -176,7 +292,7 @@ class PlexConnection:
                 'platform': r.platform,
                 'owned': r.owned
             }
-            for r in resources if r.product == 'Plex Media Server'
+            for r in resources if r.product in SERVER_PRODUCTS
         ]
-        logger.info(f"Found {len(servers)} Plex servers")
+        logger.info("Found %d Plex servers", len(servers))
         return servers
@@ -5,8 +5,8 @@ Simple test script to verify the application structure without dependencies
 import os
 import sys
 
-print("Testing SaturdayMorningPlex Application Structure")
-print("=" * 50)
+# Report lines are collected and written to stdout in one go
+lines = ["Testing SaturdayMorningPlex Application Structure", "=" * 50]
 
 # Check if files exist
 files_to_check = [
@@ -18,20 +18,36 @@ files_to_check = [
     'unraid-template.xml'
 ]
 
+def list_dir(path):
+    """Names in a directory (one scandir per directory), empty if it is missing"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+dir_contents = {}
 all_good = True
 for file in files_to_check:
-    exists = os.path.exists(file)
+    directory, name = os.path.split(file)
+    directory = directory or '.'
+    if directory not in dir_contents:
+        dir_contents[directory] = list_dir(directory)
+    exists = name in dir_contents[directory]
     status = "✓" if exists else "✗"
-    print(f"{status} {file}: {'Found' if exists else 'MISSING'}")
+    lines.append(f"{status} {file}: {'Found' if exists else 'MISSING'}")
     if not exists:
         all_good = False
 
-print("\n" + "=" * 50)
+lines.append("\n" + "=" * 50)
 if all_good:
-    print("✓ All required files are present!")
-    print("\nTo run the application, you need to install:")
-    print("  - Docker (recommended for UnRAID deployment)")
-    print("  - OR Python dependencies: pip3 install -r requirements.txt")
+    lines.append("✓ All required files are present!")
+    lines.append("\nTo run the application, you need to install:")
+    lines.append("  - Docker (recommended for UnRAID deployment)")
+    lines.append("  - OR Python dependencies: pip3 install -r requirements.txt")
 else:
-    print("✗ Some files are missing!")
+    lines.append("✗ Some files are missing!")
+
+sys.stdout.write("\n".join(lines) + "\n")
+if not all_good:
     sys.exit(1)